@@ -38,8 +38,8 @@ def add_watermark_text():
         file_key = upload_file_result.file_key
         # perform tasks
         client.execute_task(task_id)
-        # get task processing information
-        task_info = client.get_task_info(task_id)
+        # wait for the task to reach a terminal status
+        task_info = client.wait_for_task(task_id)
         # determine whether the task status is "TaskFinish"
         if task_info.task_status == CPDFConstant.TASK_FINISH:
             print(task_info)
@@ -80,8 +80,8 @@ def add_watermark_image():
         file_key = upload_file_result.file_key
         # perform tasks
         client.execute_task(task_id)
-        # get task processing information
-        task_info = client.get_task_info(task_id)
+        # wait for the task to reach a terminal status
+        task_info = client.wait_for_task(task_id)
         # determine whether the task status is "TaskFinish"
         if task_info.task_status == CPDFConstant.TASK_FINISH:
             print(task_info)
@@ -0,0 +1,27 @@
+from compdfkit.batch import run_jobs
+from compdfkit.client import CPDFClient
+from compdfkit.enums import CPDFConversionEnum, CPDFDocumentEditorEnum
+from compdfkit.param import CPDFCompressParameter, CWordToPDFParameter
+
+
+public_key = ""
+secret_key = ""
+client = CPDFClient(public_key, secret_key)
+
+
+def batch_process():
+    # Describe each job as (task type, file, file parameter)
+    compress_parameter = CPDFCompressParameter()
+    compress_parameter.quality = "50"
+    jobs = [
+        (CPDFDocumentEditorEnum.COMPRESS, "sample/test.pdf", compress_parameter),
+        (CPDFConversionEnum.DOCX_TO_PDF, "sample/test.docx", CWordToPDFParameter()),
+        (CPDFConversionEnum.PDF_TO_PNG, "sample/test.pdf", None),
+    ]
+    # Run all jobs concurrently on the shared pooled session
+    for task_info in run_jobs(client, jobs):
+        print(task_info)
+
+
+if __name__ == "__main__":
+    batch_process()
@@ -22,8 +22,8 @@ def html_to_pdf():
     file_key = upload_file_result.file_key
     # Perform tasks
     client.execute_task(task_id)
-    # Get task processing information
-    task_info = client.get_task_info(task_id)
+    # Wait for the task to reach a terminal status
+    task_info = client.wait_for_task(task_id)
     # Determine whether the task status is "TaskFinish"
     if task_info.task_status == CPDFConstant.TASK_FINISH:
         print(task_info)
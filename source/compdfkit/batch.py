@@ -0,0 +1,59 @@
+"""
+ComPDFKit API Libraries Batch Module
+
+This module runs several independent ComPDFKit tasks concurrently.
+The workload is network bound, so overlapping the create/upload/execute/poll
+roundtrips of many jobs lets N jobs finish in roughly the time of the slowest
+one instead of the sum of all of them. All workers share the pooled http
+session held by the client.
+
+Dependencies:
+    concurrent.futures: Handles the worker thread pool.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from .constant import CPDFLanguageConstant
+
+
+def run_jobs(client, jobs, max_workers=16, language=CPDFLanguageConstant.ENGLISH):
+    """
+    Run several ComPDFKit tasks concurrently and wait for all of them.
+
+    Each job is a tuple of (task_object, file, file_parameter) where
+    task_object is anything accepted by CPDFClient.create_task and
+    file_parameter may be None. The jobs are submitted to a thread pool and
+    each worker performs create_task, upload_file and execute_task. The
+    started tasks are then polled together through a single
+    wait_for_tasks loop, and get_task_info is fetched once per task for
+    the detailed result after it reaches a terminal status.
+
+    :type client: CPDFClient
+    :param client: The client used to issue the API calls.
+    :type jobs: list
+    :param jobs: The list of (task_object, file, file_parameter) tuples.
+    :type max_workers: int
+    :param max_workers: The maximum number of concurrent jobs. Default: 16.
+    :type language: int
+    :param language: The language of the log information. Default: English.
+    :return: The list of terminal task info results, in job order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_start_job, client, task_object, file, file_parameter, language)
+                   for (task_object, file, file_parameter) in jobs]
+        task_ids = [future.result() for future in futures]
+
+        # One paged task list request per tick covers every pending job,
+        # instead of a get_task_info roundtrip per job.
+        client.wait_for_tasks(task_ids)
+
+        info_futures = [executor.submit(client.get_task_info, task_id, language=language)
+                        for task_id in task_ids]
+        return [future.result() for future in info_futures]
+
+
+def _start_job(client, task_object, file, file_parameter, language):
+    create_task_result = client.create_task(task_object, language=language)
+    task_id = create_task_result.task_id
+    client.upload_file(file, task_id, file_parameter=file_parameter, language=language)
+    client.execute_task(task_id, language=language)
+    return task_id
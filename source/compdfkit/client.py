@@ -11,11 +11,22 @@ Dependencies:
     time: Handles the time related operations.
     os: Handles the file related operations.
 """
+import json
+import logging
+import random
 import requests
+import tempfile
+import threading
 import time
 import os
 
-from requests_toolbelt import MultipartEncoder
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
 
 
 from .pojo.compdfkit import CPDFOauthResult, CPDFCreateTaskResult, CPDFUploadFileResult, CPDFTaskInfoResult
@@ -23,9 +34,17 @@ from .pojo.compdfkit import CPDFTool, CPDFFileInfo
 
 from .constant import CPDFConstant, CPDFLanguageConstant
 
-from .enums import CPDFConversionEnum, CPDFDocumentAIEnum, CPDFDocumentEditorEnum
 from .exception import CPDFException
 
+try:
+    # Optional C-accelerated parser; several times faster than the stdlib
+    # on the small payloads returned by the api.
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+_log = logging.getLogger(__name__)
+
 
 class CPDFClient:
     """
@@ -88,7 +107,7 @@ class CPDFClient:
         """
         return self._http_client.get_task_list(page, size)
 
-    def create_task(self, task_object, language=CPDFLanguageConstant.ENGLISH):
+    def create_task(self, task_object, language=CPDFLanguageConstant.ENGLISH, callback_url=None):
         """
         A task ID is automatically generated for you based on the type of PDF tool you choose.
         You can provide the callback notification URL. After the task processing is completed,
@@ -97,19 +116,17 @@ class CPDFClient:
 
         :type task_object: Any
         :type language: CPDFLanguageConstant
+        :type callback_url: str
         :param task_object: The task type or url of the task.
                             The object type can be CPDFConversionEnum, CPDFDocumentAIEnum, CPDFDocumentEditorEnum, str.
         :param language: The language of log information. Default: English.
+        :param callback_url: The url notified when the task processing is completed. Default: None.
         :return: The task id.
         """
-        if isinstance(task_object, str):
-            return self._http_client.create_task(task_object, language=language)
-        elif (isinstance(task_object, CPDFConversionEnum) or
-              isinstance(task_object, CPDFDocumentAIEnum) or
-              isinstance(task_object, CPDFDocumentEditorEnum)):
-            return self.create_task(task_object.value)
-        else:
+        url_part = task_object if isinstance(task_object, str) else getattr(task_object, "value", None)
+        if not isinstance(url_part, str):
             raise CPDFException(cause="The task object is not a valid type.")
+        return self._http_client.create_task(url_part, language=language, callback_url=callback_url)
 
     def upload_file(self, file, task_id, password=None, file_parameter=None,
                     image=None, image_file_name=None, language=CPDFLanguageConstant.ENGLISH):
@@ -143,10 +160,10 @@ class CPDFClient:
 
     def _get_upload_file_result(self, file, task_id, password=None, file_parameter=None,
                                 image=None, image_file_name=None, language=CPDFLanguageConstant.ENGLISH):
-        (file_path, file_name) = os.path.split(file)
+        file_name = os.path.basename(file)
 
         if image is not None and image_file_name is None:
-            (image_path, image_file_name) = os.path.split(image)
+            image_file_name = os.path.basename(image)
 
         return self._http_client.get_upload_file_result(file=file, task_id=task_id, password=password,
                                                         file_parameter=file_parameter, file_name=file_name, image=image,
@@ -176,6 +193,135 @@ class CPDFClient:
         """
         return self._http_client.get_task_info(task_id, language=language)
 
+    def download_file(self, file_key, dest_path, workers=4, chunk=1 << 20,
+                      language=CPDFLanguageConstant.ENGLISH):
+        """
+        Download the result file of a finished task to a local path.
+
+        The body is streamed to disk in fixed-size chunks, so memory usage
+        stays O(chunk) regardless of the file size. When the server
+        advertises range support, the download is split across several
+        parallel ranged requests on the pooled session.
+
+        :type file_key: str
+        :param file_key: The key of the file.
+        :type dest_path: str
+        :param dest_path: The local path the file is written to.
+        :type workers: int
+        :param workers: The maximum number of parallel ranged requests. Default: 4.
+        :type chunk: int
+        :param chunk: The chunk size in bytes used for streaming. Default: 1MB.
+        :type language: int
+        :param language: The log language. Default: English.
+        :return: The destination path.
+        """
+        file_info = self.get_file_info(file_key, language=language)
+        return self._http_client.download_file(file_info.download_url, dest_path,
+                                               workers=workers, chunk=chunk)
+
+    def poll_many(self, task_ids, page_size=50):
+        """
+        Look up the status of several tasks with paged get_task_list calls
+        instead of one get_task_info roundtrip per task, so the polling cost
+        is O(pages) regardless of how many tasks are pending. Use
+        get_task_info for the detailed per-task metadata once a task is done.
+
+        :type task_ids: Iterable
+        :param task_ids: The ids of the tasks to look up.
+        :type page_size: int
+        :param page_size: The page size used for the task list requests. Default: 50.
+        :return: A dict mapping each found task id to its task status.
+        """
+        pending = set(task_ids)
+        statuses = {}
+        page = 1
+        while pending:
+            data = self.get_task_list(str(page), str(page_size))
+            records = data.get("records") or []
+            for record in records:
+                task_id = record.get("taskId")
+                if task_id in pending:
+                    statuses[task_id] = record.get("taskStatus")
+                    pending.discard(task_id)
+            if not records or page >= int(data.get("pages") or page):
+                break
+            page += 1
+        return statuses
+
+    def wait_for_tasks(self, task_ids, initial=0.25, factor=2.0, cap=4.0, timeout=300):
+        """
+        Poll a set of tasks until all of them reach a terminal status, using
+        a single paged task list request per tick via poll_many. The backoff
+        schedule matches wait_for_task.
+
+        :type task_ids: Iterable
+        :param task_ids: The ids of the tasks to wait for.
+        :type initial: float
+        :param initial: The first poll delay in seconds. Default: 0.25.
+        :type factor: float
+        :param factor: The multiplier applied to the delay after each poll. Default: 2.0.
+        :type cap: float
+        :param cap: The maximum poll delay in seconds. Default: 4.0.
+        :type timeout: float
+        :param timeout: The maximum total wait in seconds. Default: 300.
+        :return: A dict mapping each task id to its terminal task status.
+        """
+        deadline = time.time() + timeout
+        pending = set(task_ids)
+        statuses = {}
+        attempt = 0
+        while pending:
+            for task_id, status in self.poll_many(pending).items():
+                if status in CPDFConstant.TERMINAL_STATES:
+                    statuses[task_id] = status
+                    pending.discard(task_id)
+            if not pending:
+                break
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise CPDFException(cause=f"Tasks {sorted(pending)} did not finish within {timeout} seconds.")
+            delay = min(cap, initial * factor ** attempt) * (0.5 + random.random())
+            time.sleep(min(delay, remaining))
+            attempt += 1
+        return statuses
+
+    def wait_for_task(self, task_id, initial=0.25, factor=2.0, cap=4.0, timeout=300,
+                      language=CPDFLanguageConstant.ENGLISH):
+        """
+        Poll the task status until the task reaches a terminal status.
+
+        The poll interval grows exponentially from the initial delay up to the
+        cap, with jitter, so short tasks are detected quickly while long tasks
+        do not burn API calls. For long-running jobs, consider passing a
+        callback_url to create_task instead of polling.
+
+        :type task_id: str
+        :param task_id: The id of the task.
+        :type initial: float
+        :param initial: The first poll delay in seconds. Default: 0.25.
+        :type factor: float
+        :param factor: The multiplier applied to the delay after each poll. Default: 2.0.
+        :type cap: float
+        :param cap: The maximum poll delay in seconds. Default: 4.0.
+        :type timeout: float
+        :param timeout: The maximum total wait in seconds. Default: 300.
+        :type language: int
+        :param language: The language of the logout. Default: English.
+        :return: The terminal information of the task.
+        """
+        deadline = time.time() + timeout
+        attempt = 0
+        while True:
+            task_info = self.get_task_info(task_id, language=language)
+            if task_info.task_status in CPDFConstant.TERMINAL_STATES:
+                return task_info
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise CPDFException(cause=f"Task {task_id} did not finish within {timeout} seconds.")
+            delay = min(cap, initial * factor ** attempt) * (0.5 + random.random())
+            time.sleep(min(delay, remaining))
+            attempt += 1
+
 
 class CPDFHttpClient:
     """
@@ -184,6 +330,10 @@ class CPDFHttpClient:
 
     ADDRESS = "https://api-server.compdf.com/server/"
     _connect_timeout = -1
+    DEFAULT_TIMEOUT = 30
+    TOOLS_CACHE_TTL = 600
+    REFRESH_MARGIN_MS = 60_000
+    TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".compdfkit", "token.json")
 
     def __init__(self, public_key, secret_key, connection_timeout=-1):
         """
@@ -197,41 +347,96 @@ class CPDFHttpClient:
         self._public_key = public_key
         self._secret_key = secret_key
         self._connect_timeout = connection_timeout
+        self._timeout = connection_timeout if connection_timeout > 0 else self.DEFAULT_TIMEOUT
+        self._token_lock = threading.Lock()
+        self._tools_cache = None
+        self._tools_cache_expiry = 0.0
+        # The endpoint urls never change, so build them once instead of
+        # concatenating address and suffix on every request.
+        self._url_auth = self.ADDRESS + CPDFConstant.API_V1_OAUTH_TOKEN
+        self._url_tools = self.ADDRESS + CPDFConstant.API_V1_TOOL_SUPPORT
+        self._url_file_info = self.ADDRESS + CPDFConstant.API_V1_FILE_INFO
+        self._url_asset_info = self.ADDRESS + CPDFConstant.API_V1_ASSET_INFO
+        self._url_task_list = self.ADDRESS + CPDFConstant.API_V1_TASK_LIST
+        self._url_upload = self.ADDRESS + CPDFConstant.API_V1_UPLOAD_FILE
+        self._url_execute = self.ADDRESS + CPDFConstant.API_V1_EXECUTE_TASK
+        self._url_task_info = self.ADDRESS + CPDFConstant.API_V1_TASK_INFO
+        self._create_task_url = (self.ADDRESS + CPDFConstant.API_V1_CREATE_TASK).format
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=(502, 503, 504),
+                                                raise_on_status=False))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self.refresh_access_token()
 
-    def _handle_error_response(self, response=None):
+    def close(self):
+        """
+        Closes the underlying http session and releases the pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _handle_error_response(self, payload):
         error_code = ["01001", "01002", "01003", "01004", "01005", "01006", "01201", "01202", "01203", "01204", "01205",
                       "01206", "02001", "02002", "02201", "02203", "02204", "02205", "02206", "02207", "02208", "02209",
                       "02210", "03000", "04001", "04002", "04003", "05001", "05002", "05003", "05004", "05005", "06001",
                       "07001"]
-        code = 'code'
-        msg = response.json()['msg']
-
-        if response is not None:
-            code = response.json()['code']
-            if code == '400':
-                raise CPDFException(code=code,
-                                    message=f"Response error:{msg}. Please check your public key and secret key.")
-            elif code == '200':
-                if 'accessToken' in response.json()['data']:
-                    return
-                elif 'failureCode' in response.json()['data']:
-                    code = response.json()['data']['failureCode']
-                    msg = response.json()['data']['failureReason']
-                elif 'fileInfoDTOList' in response.json()['data']:
-                    for file_info in response.json()['data']['fileInfoDTOList']:
-                        if 'failureCode' in file_info:
-                            info_code = file_info['failureCode']
-                            info_msg = file_info['failureReason']
-
-                            if info_code in error_code:
-                                raise CPDFException(code=code,
-                                                    message=f"Failure code: {info_code}, Failure reason: {info_msg}.")
+        code = payload.get('code')
+        msg = payload.get('msg')
+
+        if code == '400':
+            raise CPDFException(code=code,
+                                message=f"Response error:{msg}. Please check your public key and secret key.")
+        elif code == '200':
+            data = payload['data']
+            if 'accessToken' in data:
+                return
+            elif 'failureCode' in data:
+                code = data['failureCode']
+                msg = data['failureReason']
+            elif 'fileInfoDTOList' in data:
+                for file_info in data['fileInfoDTOList']:
+                    if 'failureCode' in file_info:
+                        info_code = file_info['failureCode']
+                        info_msg = file_info['failureReason']
+
+                        if info_code in error_code:
+                            raise CPDFException(code=code,
+                                                message=f"Failure code: {info_code}, Failure reason: {info_msg}.")
 
         if code in error_code:
             raise CPDFException(code=code,
                                 message=f"Failure code: {code}, Failure reason: {msg}.")
 
+    def _json_or_raise(self, response, ok_cls=None, key="data"):
+        """
+        Parse the response body exactly once and turn it into a result.
+
+        Raises a CPDFException for http errors and api-level failure codes,
+        otherwise returns payload[key] wrapped in ok_cls when one is given.
+        """
+        if response.status_code != 200:
+            self._handle_error_code(response)
+        payload = _loads(response.content)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("resp %s %s", response.url, payload)
+        self._handle_error_response(payload)
+        data = payload[key] if key else payload
+        return ok_cls(data) if ok_cls else data
+
     def _handle_error_code(self, response):
         if response.status_code == 504:
             raise CPDFException(cause="504 Gateway Timeout. Please try again later.")
@@ -248,18 +453,22 @@ class CPDFHttpClient:
         else:
             raise CPDFException(cause="Unknown error. The status code is " + str(response.status_code) + ".")
 
-    def _basic_headers(self):
-        header = {"Authorization": "Bearer " + self._access_token}
-        return header
+    def _token_is_fresh(self):
+        now = int(round(time.time() * 1000))
+        return bool(self._access_token) and self._expire_time - now > self.REFRESH_MARGIN_MS
 
     def get_access_token(self):
         """
+        The token is refreshed slightly before its actual expiry
+        (REFRESH_MARGIN_MS), so in-flight requests never race against an
+        expiring token.
 
         :return: The access token of the ComPDFKit api.
         """
-        if self._expire_time < 0 or self._expire_time < int(round(time.time() * 1000)) or self._access_token == "":
-            self.refresh_access_token()
+        if self._token_is_fresh():
+            return self._access_token
 
+        self.refresh_access_token()
         return self._access_token
 
     def set_access_token(self, access_token, expires_in):
@@ -271,13 +480,59 @@ class CPDFHttpClient:
         """
         self._access_token = access_token
         self._expire_time = expires_in * 1000 + int(round(time.time() * 1000))
+        self._session.headers["Authorization"] = "Bearer " + access_token
 
     def refresh_access_token(self):
         """
         Refreshes the access token.
-        """
-        new_token = self.get_compdfkit_auth(self._public_key, self._secret_key)
-        self.set_access_token(new_token.access_token, int(new_token.expires_in))
+
+        A token cached on disk by a previous process is reused when it is
+        still valid, so a fresh process does not pay an authentication
+        roundtrip. Refreshes are serialized with a lock and double-checked
+        after acquiring it, so concurrent workers hitting an expiring token
+        issue a single authentication request instead of one each.
+        """
+        with self._token_lock:
+            if self._token_is_fresh():
+                return
+            if self._load_cached_token():
+                return
+            new_token = self.get_compdfkit_auth(self._public_key, self._secret_key)
+            self.set_access_token(new_token.access_token, int(new_token.expires_in))
+            self._store_cached_token()
+
+    def _load_cached_token(self):
+        try:
+            with open(self.TOKEN_CACHE_PATH, "r", encoding="utf8") as fh:
+                cached = json.load(fh)
+        except (OSError, ValueError):
+            return False
+
+        now = int(round(time.time() * 1000))
+        if (cached.get("publicKey") == self._public_key
+                and cached.get("accessToken")
+                and cached.get("expireTime", 0) > now + self.REFRESH_MARGIN_MS):
+            self._access_token = cached["accessToken"]
+            self._expire_time = cached["expireTime"]
+            self._session.headers["Authorization"] = "Bearer " + self._access_token
+            return True
+        return False
+
+    def _store_cached_token(self):
+        cached = {
+            "publicKey": self._public_key,
+            "accessToken": self._access_token,
+            "expireTime": self._expire_time,
+        }
+        try:
+            cache_dir = os.path.dirname(self.TOKEN_CACHE_PATH)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, "w", encoding="utf8") as fh:
+                json.dump(cached, fh)
+            os.replace(temp_path, self.TOKEN_CACHE_PATH)
+        except OSError:
+            pass
 
     def get_compdfkit_auth(self, public_key, secret_key):
         """
@@ -287,30 +542,31 @@ class CPDFHttpClient:
         :param secret_key: The secret key of the ComPDFKit api.
         :return: The result of the authentication. Type: CPDFOauthResult
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_OAUTH_TOKEN
+        url = self._url_auth
         headers = {"Content-Type": "application/json"}
         data = {"publicKey": public_key, "secretKey": secret_key}
 
-        response = requests.post(url, headers=headers, json=data)
-        if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return CPDFOauthResult(response.json()['data'])
-        else:
-            self._handle_error_code(response)
+        response = self._session.post(url, headers=headers, json=data, timeout=self._timeout)
+        return self._json_or_raise(response, CPDFOauthResult)
 
     def get_tools(self):
         """
+        The tool list rarely changes, so the response is cached in memory
+        and refetched only after TOOLS_CACHE_TTL seconds.
+
         :return: The enable tools of the ComPDFKit api. Type: list[CPDFTool]
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_TOOL_SUPPORT
-        response = requests.get(url)
-        if response.status_code == 200:
-            result = []
-            for tool in response.json()['data']:
-                result.append(CPDFTool(tool))
-            return result
-        else:
-            self._handle_error_code(response)
+        if self._tools_cache is not None and time.time() < self._tools_cache_expiry:
+            return self._tools_cache
+
+        url = self._url_tools
+        response = self._session.get(url, timeout=self._timeout)
+        result = []
+        for tool in self._json_or_raise(response):
+            result.append(CPDFTool(tool))
+        self._tools_cache = result
+        self._tools_cache_expiry = time.time() + self.TOOLS_CACHE_TTL
+        return result
 
     def get_file_info(self, file_key, language=CPDFLanguageConstant.ENGLISH):
         """
@@ -320,29 +576,17 @@ class CPDFHttpClient:
         :param language: The language of the logout. Default: English.
         :return: The file info of the file.
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_FILE_INFO
-        params = {
-            "fileKey": file_key, "language": language
-        }
-        response = requests.get(url, headers=self._basic_headers(), params=params)
-
-        if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return CPDFFileInfo(response.json()["data"])
-        else:
-            self._handle_error_code(response)
+        url = self._url_file_info + "?" + urlencode({"fileKey": file_key, "language": language})
+        response = self._session.get(url, timeout=self._timeout)
+        return self._json_or_raise(response, CPDFFileInfo)
 
     def get_asset_info(self):
         """
         :return: The assert info of the ComPDFKit api.
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_ASSET_INFO
-        response = requests.get(url, headers=self._basic_headers())
-        if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return response.json()['data']
-        else:
-            self._handle_error_code(response)
+        url = self._url_asset_info
+        response = self._session.get(url, timeout=self._timeout)
+        return self._json_or_raise(response)
 
     def get_task_list(self, page="1", size="5"):
         """
@@ -352,32 +596,28 @@ class CPDFHttpClient:
         :param size: The page size of the task list.
         :return: The task list of the ComPDFKit api.
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_TASK_LIST
+        url = self._url_task_list
         params = {"page": page, "pageSize": size}
-        response = requests.get(url, headers=self._basic_headers(), params=params)
-        if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return response.json()['data']
-        else:
-            self._handle_error_code(response)
+        response = self._session.get(url, params=params, timeout=self._timeout)
+        return self._json_or_raise(response)
 
-    def create_task(self, execute_type_url, language=CPDFLanguageConstant.ENGLISH):
+    def create_task(self, execute_type_url, language=CPDFLanguageConstant.ENGLISH, callback_url=None):
         """
         :type language: int
         :param language: The language of the logout. Default: English.
         :type execute_type_url: str
         :param execute_type_url: The execute type url of the task.
+        :type callback_url: str
+        :param callback_url: The url notified when the task processing is completed. Default: None.
         :return: The task id of the task.
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_CREATE_TASK.format(executeTypeUrl=execute_type_url)
+        url = self._create_task_url(executeTypeUrl=execute_type_url)
         params = {"language": language}
+        if callback_url:
+            params["callbackUrl"] = callback_url
 
-        response = requests.get(url, headers=self._basic_headers(), params=params)
-        if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return CPDFCreateTaskResult(response.json()['data'])
-        else:
-            self._handle_error_code(response)
+        response = self._session.get(url, params=params, timeout=self._timeout)
+        return self._json_or_raise(response, CPDFCreateTaskResult)
 
     def get_upload_file_result(self, file, task_id, password=None, file_parameter=None, file_name=None,
                                image=None, image_file_name=None, language=CPDFLanguageConstant.ENGLISH):
@@ -395,40 +635,98 @@ class CPDFHttpClient:
         :param language: The language of the logout. Default: English.
         :return:
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_UPLOAD_FILE
+        url = self._url_upload
 
         if task_id is None:
             raise CPDFException(cause="The task id is required.")
 
         if file_name is None:
-            (file_path, file_name) = os.path.split(file)
-
-        file_request_body = (file_name, open(file, "rb"))
-
-        params = {
-            "taskId": task_id,
-            "file": file_request_body,
-            "language": str(language)
-        }
-        if password:
-            params["password"] = password
-        if file_parameter:
-            parameter_json = file_parameter.to_cpdf_json_str()
-            params["parameter"] = parameter_json
-
-        if image and image_file_name:
-            params["image"] = (image_file_name, open(image, "rb"))
-
-        headers = self._basic_headers()
-
-        data = MultipartEncoder(params)
-        headers["Content-Type"] = data.content_type
-        response = requests.post(url, data=data, headers=headers)
+            file_name = os.path.basename(file)
+
+        with ExitStack() as stack:
+            file_handle = stack.enter_context(open(file, "rb"))
+
+            params = {
+                "taskId": task_id,
+                "file": (file_name, file_handle),
+                "language": str(language)
+            }
+            if password:
+                params["password"] = password
+            if file_parameter:
+                parameter_json = file_parameter.to_cpdf_json_str()
+                params["parameter"] = parameter_json
+
+            if image and image_file_name:
+                params["image"] = (image_file_name, stack.enter_context(open(image, "rb")))
+
+            # The monitor streams the encoded body in fixed-size chunks, so
+            # peak memory stays O(chunk) instead of O(filesize).
+            data = MultipartEncoderMonitor(MultipartEncoder(params))
+            headers = {"Content-Type": data.content_type}
+            response = self._session.post(url, data=data, headers=headers, timeout=self._timeout)
+        return self._json_or_raise(response, CPDFUploadFileResult)
+
+    def download_file(self, url, dest_path, workers=4, chunk=1 << 20):
+        """
+        :type url: str
+        :param url: The download url of the file.
+        :type dest_path: str
+        :param dest_path: The local path the file is written to.
+        :type workers: int
+        :param workers: The maximum number of parallel ranged requests. Default: 4.
+        :type chunk: int
+        :param chunk: The chunk size in bytes used for streaming. Default: 1MB.
+        :return: The destination path.
+        """
+        # The download url points at the file host, not the api; suppress the
+        # session's api token so it is not leaked to that host.
+        head = self._session.head(url, headers={"Authorization": None},
+                                  allow_redirects=True, timeout=self._timeout)
+        size = int(head.headers.get("Content-Length") or 0)
+        supports_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+        if supports_ranges and workers > 1 and size > chunk:
+            fd = os.open(dest_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+            try:
+                os.ftruncate(fd, size)
+                part = -(-size // workers)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(self._download_range, url, fd,
+                                               start, min(start + part, size) - 1, chunk)
+                               for start in range(0, size, part)]
+                    ranged_ok = all([future.result() for future in futures])
+            finally:
+                os.close(fd)
+            if ranged_ok:
+                return dest_path
+            # The server ignored the Range header despite advertising
+            # Accept-Ranges; retry below with one streaming request.
+
+        response = self._session.get(url, headers={"Authorization": None},
+                                     stream=True, timeout=self._timeout)
+        if response.status_code != 200:
+            self._handle_error_code(response)
+        with open(dest_path, "wb") as fh:
+            for piece in response.iter_content(chunk_size=chunk):
+                fh.write(piece)
+        return dest_path
+
+    def _download_range(self, url, fd, start, end, chunk):
+        headers = {"Range": f"bytes={start}-{end}", "Authorization": None}
+        response = self._session.get(url, headers=headers, stream=True, timeout=self._timeout)
         if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return CPDFUploadFileResult(response.json()['data'])
-        else:
+            # 200 means the Range header was ignored and the body is the
+            # whole file; writing it at this offset would corrupt the result.
+            response.close()
+            return False
+        if response.status_code != 206:
             self._handle_error_code(response)
+        offset = start
+        for piece in response.iter_content(chunk_size=chunk):
+            os.pwrite(fd, piece, offset)
+            offset += len(piece)
+        return True
 
     def execute_task(self, task_id, language=CPDFLanguageConstant.ENGLISH):
         """
@@ -438,18 +736,9 @@ class CPDFHttpClient:
         :param language: The language of the logout. Default: English.
         :return: The result of the execution.
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_EXECUTE_TASK
-        params = {
-            "taskId": task_id,
-            "language": language
-        }
-
-        response = requests.get(url, headers=self._basic_headers(), params=params)
-        if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return CPDFCreateTaskResult(response.json()['data'])
-        else:
-            self._handle_error_code(response)
+        url = self._url_execute + "?" + urlencode({"taskId": task_id, "language": language})
+        response = self._session.get(url, timeout=self._timeout)
+        return self._json_or_raise(response, CPDFCreateTaskResult)
 
     def get_task_info(self, task_id, language=CPDFLanguageConstant.ENGLISH):
         """
@@ -459,14 +748,6 @@ class CPDFHttpClient:
         :param task_id: The task id of the task.
         :return: The result of the task info.
         """
-        url = self.ADDRESS + CPDFConstant.API_V1_TASK_INFO
-        params = {
-            "taskId": task_id,
-            "language": language
-        }
-        response = requests.get(url, headers=self._basic_headers(), params=params)
-        if response.status_code == 200:
-            self._handle_error_response(response=response)
-            return CPDFTaskInfoResult(response.json()['data'])
-        else:
-            self._handle_error_code(response)
+        url = self._url_task_info + "?" + urlencode({"taskId": task_id, "language": language})
+        response = self._session.get(url, timeout=self._timeout)
+        return self._json_or_raise(response, CPDFTaskInfoResult)
@@ -0,0 +1,51 @@
+"""
+ComPDFKit API Libraries Config Module
+
+This module loads api credentials from a properties file for scripts that
+prefer not to hardcode them. The file is parsed once per process and the
+handle is closed immediately after reading.
+
+Dependencies:
+    functools: Handles the memoization.
+    yaml: Parses the properties file. Only required when this module is used.
+"""
+import functools
+
+from .client import CPDFClient
+
+
+@functools.lru_cache(maxsize=1)
+def load_properties(path="properties.yaml"):
+    """
+    Load and parse the properties file.
+
+    The result is memoized, so repeated calls parse the YAML once per
+    process. The C-accelerated libyaml loader is used when it is available.
+
+    :type path: str
+    :param path: The path of the properties file. Default: properties.yaml.
+    :return: The parsed properties dict.
+    """
+    import yaml
+
+    with open(path, "rb") as fh:
+        try:
+            return yaml.load(fh, Loader=yaml.CSafeLoader)
+        except AttributeError:
+            return yaml.safe_load(fh)
+
+
+@functools.lru_cache(maxsize=1)
+def get_client(path="properties.yaml"):
+    """
+    Build a CPDFClient from the credentials in the properties file.
+
+    The client is memoized, so every caller in the process shares one
+    client and its pooled http session.
+
+    :type path: str
+    :param path: The path of the properties file. Default: properties.yaml.
+    :return: The shared client instance.
+    """
+    properties = load_properties(path)
+    return CPDFClient(properties["public_key"], properties["secret_key"])
@@ -37,6 +37,8 @@ class CPDFConstant:
     STRING_SIGN_COLON = ":"
     PARAMS_MISSING_ERROR = "Missing required parameter!"
     TASK_FINISH = "TaskFinish"
+    TASK_FAIL = "TaskFail"
+    TERMINAL_STATES = frozenset({TASK_FINISH, TASK_FAIL})
     EXCEPTION_CODE_PARAMETERS_ERROR = 300
     EXCEPTION_CODE_SERVER_ERROR = 500
     EXCEPTION_CODE_RUNTIME_ERROR = 700
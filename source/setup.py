@@ -14,6 +14,7 @@ setup(
     url='https://api.compdf.com/api-reference/overview',
     packages=find_packages(),
     install_requires=['requests', 'requests_toolbelt'],
+    extras_require={'speedups': ['orjson']},
     license='MIT License',
     python_requires='>=3.8',
 )